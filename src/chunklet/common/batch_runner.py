@@ -30,9 +30,10 @@ def run_in_batch(
     on_errors: Literal["raise", "skip", "break"] = "raise",
     separator: Any = None,
     verbose: bool = True,
+    backend: Literal["process", "thread"] = "process",
 ) -> Generator[Any, None, None]:
     """
-    Processes a batch of items in parallel using multiprocessing.
+    Processes a batch of items in parallel using multiprocessing or threads.
     Splits the iterable into chunks and executes the function on each.
 
     Args:
@@ -47,6 +48,9 @@ def run_in_batch(
         separator: A value to be yielded after the chunks of each text are processed.
             Note: None cannot be used as a separator.
         verbose: Whether to enable verbose logging.
+        backend: Run tasks in worker processes or in threads. Threads avoid pickling
+            inputs and results, and pay off when `func` mostly runs GIL-releasing code
+            (e.g., a Rust/C tokenizer). Defaults to "process".
 
     Yields:
         A `DotDict` object containing the chunk content and metadata, or any separator object.
@@ -63,7 +67,8 @@ def run_in_batch(
 
     failed_count = 0
     try:
-        with WorkerPool(n_jobs=n_jobs) as pool:
+        pool_options = {"start_method": "threading"} if backend == "thread" else {}
+        with WorkerPool(n_jobs=n_jobs, **pool_options) as pool:
             imap_func = pool.imap if separator is not None else pool.imap_unordered
 
             progress_bar_options = {
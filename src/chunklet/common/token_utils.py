@@ -62,3 +62,41 @@ def count_tokens(text: str, token_counter: Callable[[str], int]) -> int:
             "💡 Hint: Please ensure the token counter function handles "
             f"all edge cases and returns an integer. \nDetails: {e}"
         ) from e
+
+
+def memoized_token_counter(token_counter: Callable[[str], int]) -> Callable[[str], int]:
+    """
+    Wrap a token counting function with `count_tokens` error handling and a private memo.
+
+    Meant to be created per document: every distinct string is counted at most once
+    for as long as the returned function lives, however many times it is asked for.
+
+    Args:
+        token_counter: Function that returns the number of tokens.
+
+    Returns:
+        A function that returns the (memoized) number of tokens of a string.
+
+    Raises:
+        CallbackError: If the token counter fails or returns an invalid type (when called).
+
+    Examples:
+        >>> calls = []
+        >>> def word_counter(text: str) -> int:
+        ...     calls.append(text)
+        ...     return len(text.split())
+        >>> counter = memoized_token_counter(word_counter)
+        >>> counter("Hello world, again!"), counter("Hello world, again!")
+        (3, 3)
+        >>> len(calls)
+        1
+    """
+    counts: dict[str, int] = {}
+
+    def counter(text: str) -> int:
+        tokens = counts.get(text)
+        if tokens is None:
+            tokens = counts[text] = count_tokens(text, token_counter)
+        return tokens
+
+    return counter
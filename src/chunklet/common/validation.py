@@ -1,11 +1,9 @@
 import reprlib
 from collections.abc import Iterable, Iterator
 from functools import wraps
-from itertools import tee
 from pathlib import Path
 from typing import Annotated, Any, TypeAlias
 
-from more_itertools import ilen
 from pydantic import ConfigDict, PlainValidator, ValidationError, validate_call
 
 from chunklet.exceptions import InvalidInputError
@@ -91,8 +89,8 @@ def safely_count_iterable(name: str, iterable: Iterable) -> tuple[int, Iterable]
     """
     Counts elements in an iterable while preserving its state and forcing validation.
 
-    If the input is an Iterator, it is duplicated using `itertools.tee` to prevent
-    consumption during counting. The iteration simultaneously triggers any
+    If the input is an Iterator, it is collected into a list in a single pass, so
+    counting doesn't consume it. The iteration simultaneously triggers any
     underlying Pydantic item validation.
 
     Args:
@@ -124,10 +122,10 @@ def safely_count_iterable(name: str, iterable: Iterable) -> tuple[int, Iterable]
         Sum of preserved iterator: 45
     """
     try:  # If pydantic wrap it as ValidatorIterator object
-        # Tee if it's an iterator
+        # Collect it if it's an iterator
         if isinstance(iterable, Iterator):
-            iterable, copy_iterable = tee(iterable)
-            count = ilen(copy_iterable)
+            iterable = list(iterable)
+            count = len(iterable)
         else:
             count = len(iterable)
     except ValidationError as e:
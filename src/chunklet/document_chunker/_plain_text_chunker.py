@@ -1,17 +1,18 @@
-import copy
 import re
 import sys
-from collections.abc import Iterable
-from functools import partial
+import threading
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from functools import lru_cache, partial
 from typing import Annotated, Any, Callable, Generator, Literal
 
 from loguru import logger
 from pydantic import Field
 
 from chunklet.common.batch_runner import run_in_batch
-from chunklet.common.dotdict import DotDict
+from chunklet.common.dotdict import DotDict, DotList
 from chunklet.common.logging_utils import log_info
-from chunklet.common.token_utils import count_tokens
+from chunklet.common.token_utils import memoized_token_counter
 from chunklet.common.validation import IterableOfStr, validate_input
 from chunklet.document_chunker.span_finder import DeterministicSpanFinder
 from chunklet.exceptions import (
@@ -20,8 +21,12 @@ from chunklet.exceptions import (
     MissingTokenCounterError,
 )
 from chunklet.sentence_splitter import BaseSplitter, SentenceSplitter
+from chunklet.sentence_splitter.registry import custom_splitter_registry
+from chunklet.sentence_splitter.sentence_splitter import LANG_DETECTION_MIN_CONFIDENCE
 
-CLAUSE_END_PATTERN = re.compile(r"(?<=[;,’：—)&…])\s")
+CLAUSE_END_TRIGGERS = ";,’：—)&…"
+CLAUSE_END_PATTERN = re.compile(rf"(?<=[{CLAUSE_END_TRIGGERS}])\s")
+CLAUSE_END_CHARS = frozenset(CLAUSE_END_TRIGGERS)
 SECTION_BREAK_PATTERN = re.compile(
     r"^\s*#{1,6}\s+.+?$|"  # markdown headings (# - ######)
     r"^\s*([-*_])\s*(?:\1){2,}\s*$|"  # thematic breaks (---, ***, ___)
@@ -29,6 +34,79 @@ SECTION_BREAK_PATTERN = re.compile(
     r"^\s*<hr\s*\/?>",  # HTML horizontal rule
     re.M | re.I,
 )
+# First non-space character every section break starts with
+SECTION_BREAK_PREFIXES = frozenset("#-*_<")
+# Cut points for long unpunctuated text (spaces, url and path separators)
+WORD_BREAK_PATTERN = re.compile(r"[ /\\]")
+
+# Number of texts sampled to detect a shared language in batch mode
+BATCH_LANG_SAMPLE_SIZE = 8
+# Number of leading characters of each sampled text used for that detection
+BATCH_LANG_SAMPLE_CHARS = 1000
+
+
+@lru_cache(maxsize=256)
+def _split_clauses(sentence: str) -> tuple[str, ...]:
+    """
+    Splits a sentence into clauses at clause-ending punctuation followed by whitespace.
+
+    Sentences without any clause-ending character skip the regex entirely. Results are
+    cached because the sentence that overflows a chunk is split once to fit its clauses
+    and again when the next chunk's overlap is taken.
+
+    Args:
+        sentence: The sentence to split.
+
+    Returns:
+        The clauses, as an immutable tuple since it is shared through the cache.
+    """
+    if CLAUSE_END_CHARS.isdisjoint(sentence):
+        return (sentence,)
+    return tuple(CLAUSE_END_PATTERN.split(sentence))
+
+
+def _is_section_break(text: str) -> bool:
+    """
+    Checks whether a sentence is a section break (heading, thematic break or HTML section tag).
+
+    Text whose first non-space character can't open a section break skips the regex entirely.
+
+    Args:
+        text: The sentence or clause to check.
+
+    Returns:
+        True if the text matches `SECTION_BREAK_PATTERN`.
+    """
+    stripped = text.lstrip()
+    if not stripped or stripped[0] not in SECTION_BREAK_PREFIXES:
+        return False
+    return SECTION_BREAK_PATTERN.match(text) is not None
+
+
+def _copy_chunk_value(value: Any) -> Any:
+    """
+    Copies the DotDict/DotList containers of a chunk recursively.
+
+    Unlike a `to_dict()` round trip, tuples (e.g. spans) and other values are kept
+    as they are, so a copied chunk has exactly the same types as the original.
+    """
+    if isinstance(value, dict):
+        return DotDict({k: _copy_chunk_value(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return DotList(_copy_chunk_value(v) for v in value)
+    return value
+
+
+def _chunk_keyed(
+    key: int, text: str, chunk_func: Callable[[str], list[DotDict]]
+) -> list[tuple[int, list[DotDict]]]:
+    """
+    Chunks a text and tags the chunks with the text's key, for out-of-order batches.
+
+    The result is wrapped in a one-element list because `run_in_batch` yields from
+    each task's result, so the (key, chunks) pair comes out whole.
+    """
+    return [(key, chunk_func(text))]
 
 
 class PlainTextChunker:
@@ -52,6 +130,7 @@ class PlainTextChunker:
         verbose: bool = False,
         continuation_marker: str = "...",
         token_counter: Callable[[str], int] | None = None,
+        split_cache_size: Annotated[int, Field(ge=0)] = 0,
     ):
         """
         Initialize The PlainTextChunker.
@@ -63,6 +142,9 @@ class PlainTextChunker:
             continuation_marker: The marker to prepend to unfitted clauses. Defaults to '...'.
             token_counter: Function that counts tokens in text.
                 If None, must be provided when calling chunk() methods.
+            split_cache_size: Number of `(text, lang)` sentence splits to keep, so rechunking
+                the same text skips sentence splitting. Each entry holds the whole text and its
+                sentences. Defaults to 0 (no caching).
 
         Raises:
             InvalidInputError: If any of the input arguments are invalid or if the provided `sentence_splitter` is not an instance of `BaseSplitter`.
@@ -79,9 +161,37 @@ class PlainTextChunker:
                 f"but got {type(sentence_splitter).__name__}."
             )
 
+        self.split_cache_size = split_cache_size
+        # Least recently used entries come first (dicts keep insertion order)
+        self._split_cache: dict[tuple[str, str, int], list[str]] = {}
+        self._split_cache_lock = threading.Lock()
+
         self.sentence_splitter = sentence_splitter or SentenceSplitter()
         self.sentence_splitter.verbose = self._verbose
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Leaves the split cache and its lock out, so worker processes don't receive cached documents."""
+        state = self.__dict__.copy()
+        del state["_split_cache"], state["_split_cache_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores the state with an empty split cache."""
+        self.__dict__.update(state)
+        self._split_cache = {}
+        self._split_cache_lock = threading.Lock()
+
+    @property
+    def sentence_splitter(self) -> BaseSplitter:
+        """Get the sentence splitter."""
+        return self._sentence_splitter
+
+    @sentence_splitter.setter
+    def sentence_splitter(self, value: BaseSplitter):
+        """Set the sentence splitter and drop the splits made by the previous one."""
+        self._sentence_splitter = value
+        self.clear_split_cache()
+
     @property
     def verbose(self) -> bool:
         """Get the verbosity status."""
@@ -93,11 +203,56 @@ class PlainTextChunker:
         self._verbose = value
         self.sentence_splitter.verbose = value
 
+    def clear_split_cache(self) -> None:
+        """
+        Clears the cached sentence splits.
+
+        The cache already ignores splits made before a custom splitter was (un)registered
+        or `sentence_splitter` was replaced. Call it only when a custom splitter changes
+        its own behaviour, or to free memory.
+        """
+        with self._split_cache_lock:
+            self._split_cache.clear()
+
+    def _split_sentences(self, text: str, lang: str) -> list[str]:
+        """
+        Splits a text into sentences, reusing the result of a previous call on the same text
+        when `split_cache_size` allows it.
+
+        Cached splits are keyed on the custom splitter registry version, so they are not
+        reused once a splitter is registered or unregistered. Safe to call from several threads.
+
+        Args:
+            text: The text to split.
+            lang: The language of the text.
+
+        Returns:
+            The list of sentences. It is shared with the cache and must not be modified.
+        """
+        if not self.split_cache_size:
+            return self.sentence_splitter.split_text(text, lang)
+
+        key = (text, lang, custom_splitter_registry.version)
+        with self._split_cache_lock:
+            sentences = self._split_cache.pop(key, None)
+            if sentences is not None:
+                self._split_cache[key] = sentences
+                return sentences
+
+        # Split outside the lock, so threads don't wait on each other's texts
+        sentences = self.sentence_splitter.split_text(text, lang)
+
+        with self._split_cache_lock:
+            while len(self._split_cache) >= self.split_cache_size:
+                self._split_cache.pop(next(iter(self._split_cache)))
+            self._split_cache[key] = sentences
+        return sentences
+
     def _create_chunks(
         self,
         chunks: Iterable[str],
         base_metadata: dict[str, Any],
-        span_finder: DeterministicSpanFinder,
+        span_finder: DeterministicSpanFinder | None,
     ) -> list[DotDict]:
         """
         Helper to create a list of DotDict objects for chunks with embedded metadata and auto-assigned chunk numbers.
@@ -109,24 +264,32 @@ class PlainTextChunker:
                 (e.g., 'source' file path, 'page_count' for PDFs) to be embedded
                 into each chunk's metadata.
             span_finder: The span finder instance for locating chunks.
+                If None, chunks get no 'span' metadata.
 
         Returns:
             A list of `DotDict` objects. Each `DotDict` contains:
 
                 - 'content' (str): The text of the chunk.
-                - 'metadata' (dict): A dictionary including 'chunk_num' (int)
-                    and all key-value pairs from `base_metadata`.
+                - 'metadata' (dict): A dictionary including 'chunk_num' (int), 'span' (tuple[int, int])
+                    unless spans are disabled, and all key-value pairs from `base_metadata`.
         """
         chunks_out = []
+        # Chunks come in document order, so each search resumes from the previous span start
+        search_start = 0
         for i, chunk_str in enumerate(chunks, start=1):
-            chunk = DotDict({})
-            chunk.content = chunk_str.strip()
-            chunk.metadata = copy.deepcopy(base_metadata)
-            chunk.metadata["chunk_num"] = i
-            chunk.metadata["span"] = span_finder.find_span(
-                chunk_str.removeprefix(self.continuation_marker)
+            metadata = {**base_metadata, "chunk_num": i}
+            if span_finder is not None:
+                span = span_finder.find_span(
+                    chunk_str.removeprefix(self.continuation_marker), search_start
+                )
+                if span[0] != -1:
+                    search_start = span[0]
+                metadata["span"] = span
+
+            # DotDict converts nested dicts and lists into fresh copies on construction
+            chunks_out.append(
+                DotDict({"content": chunk_str.strip(), "metadata": metadata})
             )
-            chunks_out.append(chunk)
         return chunks_out
 
     def _get_overlap_clauses(
@@ -146,9 +309,7 @@ class PlainTextChunker:
         Returns:
             A list of clauses as overlap.
         """
-        clauses = [
-            clause for sent in sentences for clause in CLAUSE_END_PATTERN.split(sent)
-        ]
+        clauses = [clause for sent in sentences for clause in _split_clauses(sent)]
 
         overlap_num = round(len(clauses) * overlap_percent / 100)
 
@@ -192,21 +353,18 @@ class PlainTextChunker:
                 - The clauses that fit within the token budget (joined as a string).
                 - The remaining unfitted clauses (joined as a string).
         """
-        clauses = CLAUSE_END_PATTERN.split(sentence)
-
-        fitted = []
-        unfitted = []
-        for i in range(len(clauses)):
-            clause_tokens = count_tokens(clauses[i], token_counter)
-
-            if clause_tokens <= remaining_tokens:
-                fitted.append(clauses[i])
-                remaining_tokens -= clause_tokens
-            else:
-                unfitted = clauses[i:]
+        clauses = _split_clauses(sentence)
+
+        # Clauses fit as a prefix, so only the cut point is tracked
+        fitted_end = 0
+        for clause in clauses:
+            clause_tokens = token_counter(clause)
+            if clause_tokens > remaining_tokens:
                 break
+            remaining_tokens -= clause_tokens
+            fitted_end += 1
 
-        return " ".join(fitted), " ".join(unfitted)
+        return " ".join(clauses[:fitted_end]), " ".join(clauses[fitted_end:])
 
     def _resolve_unpunctuated_text(
         self,
@@ -218,7 +376,9 @@ class PlainTextChunker:
         Applies greedy token cutoff to a long, unpunctuated string.
 
         Splits the text into segments (words/parts) and greedily adds them
-        to a 'fitted' part until the max_tokens limit is reached.
+        to a 'fitted' part until the max_tokens limit is reached. The per-part counts
+        only estimate the joined text, so the result is then counted as a whole and
+        trimmed from the end until it fits.
 
         Args:
             text: The input string to be processed.
@@ -228,14 +388,20 @@ class PlainTextChunker:
         Returns:
             The fitted part of the text, truncated to fit within max_tokens.
         """
-        token_count = 0
+        # The "..." suffix is counted once, then each part adds its own tokens
+        token_count = token_counter("...")
         fitted_parts = []
-        for part in re.split(r"[ /\\]", text):
-            part_tokens = count_tokens(part + "...", token_counter)
-            if token_count + part_tokens > max_tokens:
+        for part in WORD_BREAK_PATTERN.split(text):
+            token_count += token_counter(part)
+            if token_count > max_tokens:
                 break
             fitted_parts.append(part)
-        return " ".join(fitted_parts) + "..."
+
+        fitted = " ".join(fitted_parts) + "..."
+        while fitted_parts and token_counter(fitted) > max_tokens:
+            fitted_parts.pop()
+            fitted = " ".join(fitted_parts) + "..."
+        return fitted
 
     def _prepare_next_chunk(
         self,
@@ -267,50 +433,52 @@ class PlainTextChunker:
         """
         overlap_clauses = self._get_overlap_clauses(curr_chunk, overlap_percent)
 
-        constraint_counter["token_count"] = 0
-        if max_tokens != sys.maxsize:
-            constraint_counter["token_count"] = sum(
-                count_tokens(s, token_counter) for s in overlap_clauses
-            )
-
-        constraint_counter["sentence_count"] = 0
-        if max_sentences != sys.maxsize:
-            # Consider clause as sentence
-            constraint_counter["sentence_count"] = len(overlap_clauses)
-
-        constraint_counter["heading_count"] = 0
-        if max_section_breaks != sys.maxsize:
-            constraint_counter["heading_count"] = sum(
-                1 for s in overlap_clauses if SECTION_BREAK_PATTERN.match(s)
-            )
+        count_tokens = max_tokens != sys.maxsize
+        count_headings = max_section_breaks != sys.maxsize
+
+        # Gather all counts in a single pass over the overlap clauses
+        token_count = heading_count = 0
+        for clause in overlap_clauses:
+            if count_tokens:
+                token_count += token_counter(clause)
+            if count_headings and _is_section_break(clause):
+                heading_count += 1
+
+        constraint_counter["token_count"] = token_count
+        # Consider clause as sentence
+        constraint_counter["sentence_count"] = (
+            len(overlap_clauses) if max_sentences != sys.maxsize else 0
+        )
+        constraint_counter["heading_count"] = heading_count
 
         return overlap_clauses
 
     def _group_by_chunk(
         self,
         sentences: list[str],
+        offset: int,
         token_counter: Callable[[str], int] | None,
         max_tokens: int,
         max_sentences: int,
         max_section_breaks: int,
         overlap_percent: int | float,
-    ) -> list[str]:
+    ) -> Generator[str, None, None]:
         """
         Groups sentences into chunks based on the specified constraints.
         Applies overlap logic between consecutive chunks.
 
         Args:
-            sentences: A list of sentences to be chunked.
+            sentences: A list of sentences to be chunked. It is never modified.
+            offset: Index of the sentence to start chunking from.
             token_counter: The token counting function.
             max_tokens: Maximum number of tokens per chunk.
             max_sentences: Maximum number of sentences per chunk.
             max_section_breaks: Maximum number of section breaks per chunk.
             overlap_percent: Percentage of overlap between chunks.
 
-        Returns:
-            A list of chunk strings.
+        Yields:
+            Chunk strings, each as soon as it is complete.
         """
-        chunks = []
         curr_chunk = []
         constraint_counter = {
             "token_count": 0,
@@ -318,20 +486,19 @@ class PlainTextChunker:
             "heading_count": 0,
         }
 
-        index = 0
+        # Constant for the whole text, so checked once rather than per sentence
+        token_limited = max_tokens != sys.maxsize
+
+        index = offset
         while index < len(sentences):
             sentence = sentences[index]
 
             is_heading = False
-            if SECTION_BREAK_PATTERN.match(sentence):
+            if _is_section_break(sentence):
                 is_heading = True
                 sentence = "\n" + sentence
 
-            sentence_tokens = (
-                count_tokens(sentence + "\n", token_counter)
-                if max_tokens != sys.maxsize
-                else 0
-            )
+            sentence_tokens = token_counter(sentence + "\n") if token_limited else 0
 
             sentence_limit_reached = (
                 constraint_counter["sentence_count"] + 1 > max_sentences
@@ -341,13 +508,11 @@ class PlainTextChunker:
                 and constraint_counter["heading_count"] + 1 > max_section_breaks
             )
             token_limit_reached = (
-                max_tokens != sys.maxsize
+                token_limited
                 and constraint_counter["token_count"] + sentence_tokens > max_tokens
             )
 
-            if any(
-                [token_limit_reached, sentence_limit_reached, heading_limit_reached]
-            ):
+            if token_limit_reached or sentence_limit_reached or heading_limit_reached:
                 # for token-based mode, try splitting further
                 unfitted = ""
                 if token_limit_reached:
@@ -376,11 +541,7 @@ class PlainTextChunker:
 
                     curr_chunk.append(fitted)
 
-                    if unfitted:
-                        # We need to process the remnants separately
-                        sentences[index] = unfitted
-
-                chunks.append("\n".join(curr_chunk))  # Considered complete
+                yield "\n".join(curr_chunk)  # Considered complete
 
                 curr_chunk = self._prepare_next_chunk(
                     curr_chunk=curr_chunk,
@@ -401,9 +562,7 @@ class PlainTextChunker:
 
         # Add the last chunk if it exists
         if curr_chunk:
-            chunks.append("\n".join(curr_chunk))
-
-        return chunks
+            yield "\n".join(curr_chunk)
 
     def _validate_constraints(
         self,
@@ -451,6 +610,7 @@ class PlainTextChunker:
         offset: Annotated[int, Field(ge=0)] = 0,
         token_counter: Callable[[str], int] | None = None,
         base_metadata: dict[str, Any] | None = None,
+        include_span: bool = True,
     ) -> list[DotDict]:
         """
         Chunks a single text into smaller pieces based on specified parameters.
@@ -468,6 +628,8 @@ class PlainTextChunker:
             token_counter: Optional token counting function.
                 Required for token-based modes only.
             base_metadata: Optional dictionary to be included with each chunk.
+            include_span: Whether to locate each chunk in the text and store it as the 'span'
+                metadata. Disable it to skip the span search when spans aren't needed. Defaults to True.
 
         Returns:
             A list of `DotDict` objects, each containing the chunk content and metadata.
@@ -500,10 +662,7 @@ class PlainTextChunker:
             return []
 
         try:
-            sentences = self.sentence_splitter.split_text(
-                text,
-                lang,
-            )
+            sentences = self._split_sentences(text, lang)
         except Exception as e:
             raise CallbackError(
                 f"An error occurred during the sentence splitting process.\nDetails: {e}\n"
@@ -522,9 +681,16 @@ class PlainTextChunker:
             )
             return []
 
+        # Each distinct sentence or clause is tokenized at most once per text
+        token_counter = token_counter or self.token_counter
+        if token_counter is not None:
+            token_counter = memoized_token_counter(token_counter)
+
+        # Chunks are generated lazily and wrapped into DotDicts as they come
         chunks = self._group_by_chunk(
-            sentences[offset:],
-            token_counter=token_counter or self.token_counter,
+            sentences,
+            offset=offset,
+            token_counter=token_counter,
             max_tokens=max_tokens,
             max_sentences=max_sentences,
             max_section_breaks=max_section_breaks,
@@ -533,9 +699,115 @@ class PlainTextChunker:
 
         # Note: We use DeterministicSpanFinder because sentence splitter may modify text
         # (e.g., normalize whitespace, fix encoding), making exact span tracking difficult.
-        span_finder = DeterministicSpanFinder(text)
+        span_finder = DeterministicSpanFinder(text) if include_span else None
         return self._create_chunks(chunks, base_metadata or {}, span_finder)
 
+    def _resolve_batch_language(self, texts: Sequence[str]) -> str:
+        """
+        Detects a single language for a whole batch from the beginning of a few texts spread over it.
+
+        Only a `SentenceSplitter` knows how to detect languages, so custom splitters
+        keep the per-text detection. The batch language is used only when every
+        sampled text is detected as the same language with enough confidence.
+
+        Args:
+            texts: The texts of the batch.
+
+        Returns:
+            The detected language, or 'auto' if the sample is undecided.
+        """
+        if not isinstance(self.sentence_splitter, SentenceSplitter):
+            return "auto"
+
+        # Spread the sample over the whole batch, first and last texts included, so
+        # later documents get a say too rather than sections of the first one only
+        if len(texts) <= BATCH_LANG_SAMPLE_SIZE:
+            sample = texts
+        else:
+            step = (len(texts) - 1) / (BATCH_LANG_SAMPLE_SIZE - 1)
+            sample = [texts[round(i * step)] for i in range(BATCH_LANG_SAMPLE_SIZE)]
+        detected_langs = set()
+        for text in sample:
+            if not isinstance(text, str) or not text.strip():
+                continue
+            lang_detected, confidence = self.sentence_splitter.detected_top_language(
+                text[:BATCH_LANG_SAMPLE_CHARS]
+            )
+            if confidence < LANG_DETECTION_MIN_CONFIDENCE:
+                return "auto"
+            detected_langs.add(lang_detected)
+
+        if len(detected_langs) != 1:
+            return "auto"
+
+        lang = detected_langs.pop()
+        log_info(
+            self.verbose,
+            "Batch language detected as '{}' from {} sampled texts.",
+            lang,
+            len(sample),
+        )
+        return lang
+
+    def _expand_unique_results(
+        self,
+        keyed_results: Iterable[tuple[int, list[DotDict]]],
+        text_keys: list[int],
+        separator: Any,
+        on_errors: Literal["raise", "skip", "break"],
+    ) -> Generator[Any, None, None]:
+        """
+        Expands the chunks of deduplicated texts back to every input position.
+
+        Each unique text is chunked once and its chunks are yielded for every
+        occurrence. Repeated occurrences get deep copies of the chunks, nested
+        metadata included, so callers can update chunk metadata freely. Failed texts are missing
+        from `keyed_results`. They are skipped, or with `on_errors="break"` and a separator, end
+        the output so it stays a prefix of the input positions.
+
+        Args:
+            keyed_results: An iterable of (unique text key, chunks) pairs, in any order.
+            text_keys: The unique text key of each input position.
+            separator: A value to be yielded after the chunks of each text.
+                If None, chunks are yielded as soon as they are available.
+            on_errors: How failed tasks were handled by the batch runner.
+
+        Yields:
+            A `DotDict` object containing the chunk content and metadata, or any separator object.
+        """
+        occurrences = Counter(text_keys)
+        chunks_by_key = {}
+
+        def take(key: int) -> list[DotDict]:
+            occurrences[key] -= 1
+            if occurrences[key] == 0:
+                return chunks_by_key.pop(key)
+            return [_copy_chunk_value(chunk) for chunk in chunks_by_key[key]]
+
+        if separator is None:
+            for key, chunks in keyed_results:
+                chunks_by_key[key] = chunks
+                while occurrences[key]:
+                    yield from take(key)
+            return
+
+        # Keep the input order: release positions as soon as their chunks are ready
+        pos = 0
+        for key, chunks in keyed_results:
+            chunks_by_key[key] = chunks
+            while pos < len(text_keys) and text_keys[pos] in chunks_by_key:
+                yield from take(text_keys[pos])
+                yield separator
+                pos += 1
+
+        # Flush whatever is left behind the failed texts
+        for key in text_keys[pos:]:
+            if key not in chunks_by_key and on_errors == "break":
+                break
+            if key in chunks_by_key:
+                yield from take(key)
+                yield separator
+
     @validate_input
     def batch_chunk(
         self,
@@ -553,6 +825,9 @@ class PlainTextChunker:
         n_jobs: Annotated[int, Field(ge=1)] | None = None,
         show_progress: bool = True,
         on_errors: Literal["raise", "skip", "break"] = "raise",
+        backend: Literal["process", "thread"] = "process",
+        sort_by_length: bool = False,
+        include_span: bool = True,
     ) -> Generator[Any, None, None]:
         """
         Processes a batch of texts in parallel, splitting each into chunks.
@@ -561,6 +836,8 @@ class PlainTextChunker:
         If a task fails, `chunklet` will now stop processing and return the results
         of the tasks that completed successfully, preventing wasted work.
 
+        Identical texts are chunked only once; their chunks are repeated for every occurrence.
+
         Args:
             texts: A non-string iterable of input texts to be chunked.
             lang: The language of the text (e.g., 'en', 'fr', 'auto'). Defaults to "auto".
@@ -579,6 +856,14 @@ class PlainTextChunker:
             show_progress: Flag to show or disable the loading bar.
             on_errors: How to handle errors during processing.
                 Defaults to 'raise'.
+            backend: Run the chunking tasks in worker processes or in threads.
+                Threads skip pickling texts and chunks, which pays off when the token counter
+                releases the GIL (e.g., tiktoken, Hugging Face fast tokenizers). Defaults to 'process'.
+            sort_by_length: Dispatch the longest texts first, so one long text doesn't keep a
+                single worker busy after the others are done. Results still come back in input order
+                when a `separator` is set, but `on_errors="break"` may then keep a different set of
+                completed texts. Defaults to False.
+            include_span: Whether to store each chunk's 'span' metadata. Defaults to True.
 
         Yields:
             A `DotDict` object containing the chunk content and metadata, or any separator object.
@@ -589,6 +874,22 @@ class PlainTextChunker:
             CallbackError: If an error occurs during sentence splitting
                 or token counting within a chunking task.
         """
+        # Chunk each distinct text only once
+        unique_texts = []
+        text_keys = []
+        seen = {}
+        for text in texts:
+            key = seen.get(text) if isinstance(text, str) else None
+            if key is None:
+                key = len(unique_texts)
+                unique_texts.append(text)
+                if isinstance(text, str):
+                    seen[text] = key
+            text_keys.append(key)
+
+        if lang == "auto":
+            lang = self._resolve_batch_language(unique_texts)
+
         chunk_func = partial(
             self.chunk,
             lang=lang,
@@ -599,15 +900,49 @@ class PlainTextChunker:
             offset=offset,
             base_metadata=base_metadata,
             token_counter=token_counter or self.token_counter,
+            include_span=include_span,
         )
 
-        yield from run_in_batch(
-            func=chunk_func,
-            iterable_of_args=texts,
+        if len(unique_texts) == len(text_keys) and not sort_by_length:
+            yield from run_in_batch(
+                func=chunk_func,
+                iterable_of_args=unique_texts,
+                iterable_name="texts",
+                n_jobs=n_jobs,
+                show_progress=show_progress,
+                on_errors=on_errors,
+                separator=separator,
+                verbose=self.verbose,
+                backend=backend,
+            )
+            return
+
+        if len(unique_texts) < len(text_keys):
+            log_info(
+                self.verbose,
+                "Found {} duplicated texts. Chunking {} unique texts.",
+                len(text_keys) - len(unique_texts),
+                len(unique_texts),
+            )
+
+        keyed_texts = list(enumerate(unique_texts))
+        if sort_by_length:
+            # Longest first, to cut the straggler tail on uneven batches
+            keyed_texts.sort(
+                key=lambda item: len(item[1]) if isinstance(item[1], str) else 0,
+                reverse=True,
+            )
+
+        keyed_results = run_in_batch(
+            func=partial(_chunk_keyed, chunk_func=chunk_func),
+            iterable_of_args=keyed_texts,
             iterable_name="texts",
             n_jobs=n_jobs,
             show_progress=show_progress,
             on_errors=on_errors,
-            separator=separator,
             verbose=self.verbose,
+            backend=backend,
+        )
+        yield from self._expand_unique_results(
+            keyed_results, text_keys, separator, on_errors
         )
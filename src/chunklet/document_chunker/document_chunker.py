@@ -85,6 +85,7 @@ class DocumentChunker(BaseChunker):
         verbose: bool = False,
         continuation_marker: str = "...",
         token_counter: Callable[[str], int] | None = None,
+        split_cache_size: int = 0,
     ):
         """
         Initializes the DocumentChunker.
@@ -96,6 +97,8 @@ class DocumentChunker(BaseChunker):
             continuation_marker: The marker to prepend to unfitted clauses. Defaults to '...'.
             token_counter: Function that counts tokens in text.
                 If None, must be provided when calling chunk() methods.
+            split_cache_size: Number of `(text, lang)` sentence splits to keep for rechunking
+                the same text with other limits. Defaults to 0 (no caching).
 
         Raises:
             InvalidInputError: If any of the input arguments are invalid or if the provided `sentence_splitter` is not an instance of `BaseSplitter`.
@@ -118,6 +121,7 @@ class DocumentChunker(BaseChunker):
             verbose=self._verbose,
             continuation_marker=self.continuation_marker,
             token_counter=self.token_counter,
+            split_cache_size=split_cache_size,
         )
 
         self.processors = {
@@ -352,6 +356,7 @@ class DocumentChunker(BaseChunker):
         offset: Annotated[int, Field(ge=0)] = 0,
         token_counter: Callable[[str], int] | None = None,
         base_metadata: dict[str, Any] | None = None,
+        include_span: bool = True,
     ) -> list[DotDict]:
         """
         Chunks raw text content.
@@ -369,6 +374,7 @@ class DocumentChunker(BaseChunker):
             token_counter: Optional token counting function.
                 Required if `max_tokens` is provided.
             base_metadata: Optional dictionary to be included with each chunk.
+            include_span: Whether to store each chunk's 'span' metadata. Defaults to True.
 
         Returns:
             A list of `DotDict` objects, each representing a chunk.
@@ -394,6 +400,9 @@ class DocumentChunker(BaseChunker):
         n_jobs: Annotated[int, Field(ge=1)] | None = None,
         show_progress: bool = True,
         on_errors: Literal["raise", "skip", "break"] = "raise",
+        backend: Literal["process", "thread"] = "process",
+        sort_by_length: bool = False,
+        include_span: bool = True,
     ) -> Generator[DotDict, None, None]:
         """
         Chunks multiple text contents.
@@ -415,6 +424,11 @@ class DocumentChunker(BaseChunker):
             n_jobs: Number of parallel workers.
             show_progress: Show progress bar.
             on_errors: How to handle errors.
+            backend: Run the chunking tasks in worker processes or in threads.
+                Threads pay off with GIL-releasing token counters. Defaults to "process".
+            sort_by_length: Dispatch the longest texts first to keep all workers busy
+                on uneven batches. Defaults to False.
+            include_span: Whether to store each chunk's 'span' metadata. Defaults to True.
 
         yields:
             `DotDict` object, representing a chunk with its content and metadata.
@@ -441,6 +455,7 @@ class DocumentChunker(BaseChunker):
         overlap_percent: Annotated[int, Field(ge=0, le=75)] = 20,
         offset: Annotated[int, Field(ge=0)] = 0,
         token_counter: Callable[[str], int] | None = None,
+        include_span: bool = True,
     ) -> list[DotDict]:
         """
         Chunks a single document from a given path.
@@ -461,6 +476,7 @@ class DocumentChunker(BaseChunker):
             offset: Starting sentence offset for chunking. Defaults to 0.
             token_counter: Optional token counting function.
                 Required if `max_tokens` is provided.
+            include_span: Whether to store each chunk's 'span' metadata. Defaults to True.
 
         Returns:
             A list of `DotDict` objects, each representing
@@ -497,6 +513,7 @@ class DocumentChunker(BaseChunker):
             overlap_percent=overlap_percent,
             offset=offset,
             token_counter=token_counter or self.token_counter,
+            include_span=include_span,
         )
 
         for chunk in chunks_out:
@@ -522,6 +539,9 @@ class DocumentChunker(BaseChunker):
         n_jobs: Annotated[int, Field(ge=1)] | None = None,
         show_progress: bool = True,
         on_errors: Literal["raise", "skip", "break"] = "raise",
+        backend: Literal["process", "thread"] = "process",
+        sort_by_length: bool = False,
+        include_span: bool = True,
     ) -> Generator[DotDict, None, None]:
         """
         Chunks multiple documents from a list of file paths.
@@ -549,6 +569,11 @@ class DocumentChunker(BaseChunker):
                    Must be >= 1 if specified.
             show_progress: Flag to show or disable the loading bar.
             on_errors: How to handle errors during processing. Can be 'raise', 'ignore', or 'break'.
+            backend: Run the chunking tasks in worker processes or in threads.
+                Threads pay off with GIL-releasing token counters. Defaults to "process".
+            sort_by_length: Dispatch the longest texts first to keep all workers busy
+                on uneven batches. Defaults to False.
+            include_span: Whether to store each chunk's 'span' metadata. Defaults to True.
 
         yields:
             `DotDict` object, representing a chunk with its content and metadata.
@@ -577,6 +602,9 @@ class DocumentChunker(BaseChunker):
             n_jobs=n_jobs,
             show_progress=show_progress,
             on_errors=on_errors,
+            backend=backend,
+            sort_by_length=sort_by_length,
+            include_span=include_span,
         )
 
         all_chunk_groups = split_at(all_chunks_gen, lambda x: x is sentinel)
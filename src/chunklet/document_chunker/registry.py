@@ -9,6 +9,9 @@ from chunklet.exceptions import CallbackError, InvalidInputError
 # A tuple containing the extracted text(s) and a dictionary of metadata.
 ReturnType = tuple[str | Iterable[str], dict[str, Any]]
 
+# Validator for processor results, compiled once at import
+_PROCESSOR_RESULT_ADAPTER = TypeAdapter(ReturnType)
+
 
 class CustomProcessorRegistry:
     _instance = None
@@ -171,7 +174,7 @@ class CustomProcessorRegistry:
         if not processor_info:
             raise InvalidInputError(
                 f"No document processor registered for file extension '{ext}'.\n"
-                f"💡Hint: Use `register('{ext}', callback=your_function)` first."
+                f"💡Hint: Use `.register(your_function, '{ext}')` first."
             )
 
         name, callback = processor_info
@@ -179,8 +182,7 @@ class CustomProcessorRegistry:
         try:
             # Validate the return type
             result = callback(file_path)
-            validator = TypeAdapter(ReturnType)
-            validator.validate_python(result)
+            _PROCESSOR_RESULT_ADAPTER.validate_python(result)
         except ValidationError as e:
             e.subtitle = f"{name} result"
             e.hint = (
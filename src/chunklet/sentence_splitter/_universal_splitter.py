@@ -1,4 +1,6 @@
-import regex as re
+import re
+
+import regex
 
 from chunklet.sentence_splitter.terminators import GLOBAL_SENTENCE_TERMINATORS
 
@@ -22,18 +24,19 @@ class UniversalSplitter:
 
     def __init__(self):
         self.sentence_terminators = "".join(GLOBAL_SENTENCE_TERMINATORS)
-        self.flattened_numbered_list_pattern = re.compile(
+        self.flattened_numbered_list_pattern = regex.compile(
             rf"(?<=[{self.sentence_terminators}:])\s+(\p{{N}}\.)+"
         )
 
-        self.quote_or_paren_pattern = re.compile(
+        self.quote_or_paren_pattern = regex.compile(
             r"(\p{Pi}|['\"]).+?(\p{Pf}|\1)|"
             r"\p{Ps}.+?\p{Pe}",
-            re.DOTALL,
+            regex.DOTALL,
         )
 
+        # Plain ASCII pattern, so the faster stdlib engine is enough
         self.hashed_pattern = re.compile(r"##-?\d+##")
-        self.numbered_list_pattern = re.compile(r"[\n:]\s*\p{N}\.")
+        self.numbered_list_pattern = regex.compile(r"[\n:]\s*\p{N}\.")
 
         # Core sentence split regex
         # NOTE: Acronyms like "U.S.A" are protected primarily by the lookahead (?=\s+...).
@@ -41,13 +44,13 @@ class UniversalSplitter:
         # and no split occurs. The negative lookbehind handles other abbreviations like "Dr."
         # This means acronym protection is *not* dependent on masking—it's explicit in the
         # lookahead requirement for whitespace or newline before the next uppercase letter.
-        self.sentence_end_pattern = re.compile(
+        self.sentence_end_pattern = regex.compile(
             rf"""
             (?<!\b(\p{{Lu}}\p{{Ll}}{{1, 4}}\.)*)   # Latin-only abbreviation
             (?<=[{self.sentence_terminators}])       # sentence-ending punctuation
             (?=\s+[\p{{Lu}}\p{{Lo}}\p{{Lt}}]|\s*\n|\s*$)  # followed by letter (upper or catch-all) or end
             """,
-            re.VERBOSE,
+            regex.VERBOSE,
         )
 
     def split(self, text: str) -> list[str]:
@@ -61,7 +64,7 @@ class UniversalSplitter:
             A list of sentences after segmentation.
         """
 
-        def mask(match: re.Match, norm_map: dict):
+        def mask(match: regex.Match, norm_map: dict):
             # Generate the integer hash and Convert to string
             # because re.sub MUST return a string
             # Also fence them for easy detection
@@ -89,9 +92,11 @@ class UniversalSplitter:
             if sent:
                 final_sentences.extend(sent.strip().splitlines())
 
-        # Restore the normalization
+        # Restore the normalization, only rewriting sentences that hold a mask
         return [
             self.hashed_pattern.sub(lambda m: unmask(m, norm_map), sent)
+            if norm_map and "##" in sent
+            else sent
             for sent in final_sentences
             if sent.strip()
         ]
@@ -11,23 +11,25 @@ from yasbd import get_supported_langs
 # Yasbd is our own lib. Built to mor emore accurate and faster than PySBD
 # and it support multiple languages (39)
 # https://github.com/speedyk-005/yasbd-lib#-supported-languages-api
-YASBD_SUPPORTED_LANGUAGES = set(get_supported_langs()) - {"auto"}
+YASBD_SUPPORTED_LANGUAGES = frozenset(get_supported_langs()) - {"auto"}
 
 
 # Languages unique to Indic NLP Library that are NOT supported by the other libraries (11)
-INDIC_NLP_UNIQUE_LANGUAGES = {
-    "as",  # Assamese
-    "bn",  # Bengali
-    "gu",  # Gujarati
-    "kn",  # Kannada
-    "ml",  # Malayalam
-    "ne",  # Nepali
-    "or",  # Odia
-    "pa",  # Punjabi
-    "sa",  # Sanskrit
-    "ta",  # Tamil
-    "te",  # Telugu
-}
+INDIC_NLP_UNIQUE_LANGUAGES = frozenset(
+    {
+        "as",  # Assamese
+        "bn",  # Bengali
+        "gu",  # Gujarati
+        "kn",  # Kannada
+        "ml",  # Malayalam
+        "ne",  # Nepali
+        "or",  # Odia
+        "pa",  # Punjabi
+        "sa",  # Sanskrit
+        "ta",  # Tamil
+        "te",  # Telugu
+    }
+)
 
 
 # Languages unique to Sentencex that are NOT supported by the other libraries (14)
@@ -39,25 +41,27 @@ INDIC_NLP_UNIQUE_LANGUAGES = {
 #    *   Include only languages with an ISO 639-1 code.
 #    *   Exclude languages that are already covered by `pysbd`, `sentsplit`, or `Indic NLP Library`.
 #    *   Exclude languages that are fallbacks to other languages but are not reliable enough.
-SENTENCEX_UNIQUE_LANGUAGES = {
-    "an",  # Aragonese
-    "ca",  # Catalan
-    "co",  # Corsican
-    "fi",  # Finnish
-    "gl",  # Galician
-    "io",  # Ido
-    "jv",  # Javanese
-    "li",  # Limburgish
-    "mo",  # Moldovan
-    "nds",  # Low German
-    "nn",  # Norwegian Nynorsk
-    "oc",  # Occitan
-    "su",  # Sundanese
-    "wa",  # Walloon
-}
-
-
-# Set of all supported languages
+SENTENCEX_UNIQUE_LANGUAGES = frozenset(
+    {
+        "an",  # Aragonese
+        "ca",  # Catalan
+        "co",  # Corsican
+        "fi",  # Finnish
+        "gl",  # Galician
+        "io",  # Ido
+        "jv",  # Javanese
+        "li",  # Limburgish
+        "mo",  # Moldovan
+        "nds",  # Low German
+        "nn",  # Norwegian Nynorsk
+        "oc",  # Occitan
+        "su",  # Sundanese
+        "wa",  # Walloon
+    }
+)
+
+
+# Set of all supported languages (frozensets, as none of them change at runtime)
 SUPPORTED_LANGUAGES = (
     YASBD_SUPPORTED_LANGUAGES | INDIC_NLP_UNIQUE_LANGUAGES | SENTENCEX_UNIQUE_LANGUAGES
 )
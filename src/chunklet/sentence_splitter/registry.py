@@ -6,6 +6,9 @@ from pydantic import TypeAdapter, ValidationError
 from chunklet.common.validation import pretty_errors, validate_input
 from chunklet.exceptions import CallbackError
 
+# Built once, since building a TypeAdapter compiles a pydantic-core validator
+_SPLITTER_RESULT_ADAPTER = TypeAdapter(list[str])
+
 
 class CustomSplitterRegistry:
     _instance = None
@@ -14,8 +17,19 @@ class CustomSplitterRegistry:
         if cls._instance is None:
             cls._instance = super(CustomSplitterRegistry, cls).__new__(cls)
             cls._instance._splitters: dict[str, tuple[str, Callable]] = {}
+            cls._instance._version = 0
         return cls._instance
 
+    @property
+    def version(self) -> int:
+        """
+        A counter bumped on every registry change.
+
+        Lets callers that cache split results detect that a splitter was
+        registered, unregistered or cleared since they were computed.
+        """
+        return self._version
+
     @property
     def splitters(self):
         """
@@ -68,8 +82,11 @@ class CustomSplitterRegistry:
                 "💡Hint: Optional parameters with default values are allowed."
             )
 
+        # One entry shared by every language of this registration
+        entry = (splitter_name, callback)
         for lang in langs:
-            self._splitters[lang] = (splitter_name, callback)
+            self._splitters[lang] = entry
+        self._version += 1
 
     def register(self, *args: Any, name: str | None = None):
         """
@@ -123,12 +140,14 @@ class CustomSplitterRegistry:
         """
         for lang in langs:
             self._splitters.pop(lang, None)
+        self._version += 1
 
     def clear(self) -> None:
         """
         Clears all registered splitters from the registry.
         """
         self._splitters.clear()
+        self._version += 1
 
     @validate_input
     def split(self, text: str, lang: str) -> tuple[list[str], str]:
@@ -159,7 +178,7 @@ class CustomSplitterRegistry:
         if not splitter_info:
             raise CallbackError(
                 f"No splitter registered for language '{lang}'.\n"
-                f"💡Hint: Use `.register('{lang}', fn=your_function)` first."
+                f"💡Hint: Use `.register(your_function, '{lang}')` first."
             )
 
         name, callback = splitter_info
@@ -167,8 +186,7 @@ class CustomSplitterRegistry:
         try:
             # Validate the return type
             result = callback(text)
-            validator = TypeAdapter(list[str])
-            validator.validate_python(result)
+            _SPLITTER_RESULT_ADAPTER.validate_python(result)
         except ValidationError as e:
             e.subtitle = f"{name} result"
             e.hint = "💡Hint: Make sure your splitter returns a list of strings."
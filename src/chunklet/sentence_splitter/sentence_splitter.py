@@ -26,6 +26,21 @@ PUNCTUATION_ONLY_PATTERN = re.compile(r"\W+")
 # To identify thematic breaks (e.g., '---', '***', '___')
 THEMATIC_BREAK_PATTERN = re.compile(r"\s*([-*_])\s*\1{2,}\s*")
 
+# Minimum confidence for a detected language to be used instead of the fallback splitter
+LANG_DETECTION_MIN_CONFIDENCE = 0.7
+
+
+@lru_cache(maxsize=1)
+def _get_fallback_splitter() -> UniversalSplitter:
+    """Returns the shared universal splitter. It's stateless, so all instances can reuse its compiled patterns."""
+    return UniversalSplitter()
+
+
+@lru_cache(maxsize=1)
+def _get_language_identifier() -> LanguageIdentifier:
+    """Returns the shared language identifier, so the pickled model is loaded once per process."""
+    return LanguageIdentifier.from_pickled_model(MODEL_FILE, norm_probs=True)
+
 
 class BaseSplitter:
     """
@@ -94,12 +109,10 @@ class SentenceSplitter(BaseSplitter):
             verbose: If True, enables verbose logging for debugging and informational messages.
         """
         self.verbose = verbose
-        self.fallback_splitter = UniversalSplitter()
+        self.fallback_splitter = _get_fallback_splitter()
 
-        # Create a normalized identifier for language detection
-        self._identifier = LanguageIdentifier.from_pickled_model(
-            MODEL_FILE, norm_probs=True
-        )
+        # Normalized identifier for language detection, shared by all instances
+        self._identifier = _get_language_identifier()
 
         # Tracked to reduce log spamming about language detection
         self._last_lang_used = None
@@ -216,7 +229,11 @@ class SentenceSplitter(BaseSplitter):
                     "to a specific language to improve reliability."
                 )
             lang_detected, confidence = self.detected_top_language(text)
-            lang = lang_detected if confidence >= 0.7 else "fallback"
+            lang = (
+                lang_detected
+                if confidence >= LANG_DETECTION_MIN_CONFIDENCE
+                else "fallback"
+            )
 
         self._last_lang_used = lang
 
@@ -1,4 +1,5 @@
 import re
+import threading
 
 import pytest
 from more_itertools import split_at
@@ -9,8 +10,15 @@ from chunklet import (
     MissingTokenCounterError,
 )
 from chunklet.document_chunker import DocumentChunker
-from chunklet.document_chunker._plain_text_chunker import SECTION_BREAK_PATTERN
-from chunklet.sentence_splitter import SentenceSplitter
+from chunklet.document_chunker._plain_text_chunker import (
+    BATCH_LANG_SAMPLE_CHARS,
+    SECTION_BREAK_PATTERN,
+)
+from chunklet.sentence_splitter import (
+    BaseSplitter,
+    SentenceSplitter,
+    custom_splitter_registry,
+)
 
 # --- Constants ---
 
@@ -160,6 +168,108 @@ def test_long_sentence_truncation(chunker):
     assert chunks[0].content.endswith("..."), (
         f"Chunk '{chunks[0].content}' does not end with '...'"
     )
+    assert chunker.token_counter(chunks[0].content) <= 30
+
+
+def test_long_unpunctuated_text_respects_max_tokens():
+    """Test that truncated text fits max_tokens with a counter that isn't additive over parts."""
+
+    def char_token_counter(text: str) -> int:
+        return len(text) // 4
+
+    chunker = DocumentChunker(token_counter=char_token_counter)
+    url = "https://example.com/" + "/".join(f"segment{i}" for i in range(200))
+    chunks = chunker.chunk_text(url, lang="en", max_tokens=40)
+
+    assert chunks[0].content.endswith("...")
+    assert char_token_counter(chunks[0].content) <= 40
+
+
+def test_sentence_split_cache():
+    """Test that the opt-in split cache reuses sentence splits, evicts old ones and can be cleared."""
+
+    class CountingSplitter(BaseSplitter):
+        def __init__(self):
+            self.calls = 0
+
+        def split_text(self, text: str, lang: str = "auto") -> list[str]:
+            self.calls += 1
+            return text.split(". ")
+
+    # Disabled by default
+    splitter = CountingSplitter()
+    chunker = DocumentChunker(sentence_splitter=splitter)
+    chunker.chunk_text("One. Two. Three", max_sentences=1)
+    chunker.chunk_text("One. Two. Three", max_sentences=2)
+    assert splitter.calls == 2
+    assert chunker.plain_text_chunker._split_cache == {}
+
+    splitter = CountingSplitter()
+    chunker = DocumentChunker(sentence_splitter=splitter, split_cache_size=1)
+
+    first = chunker.chunk_text("One. Two. Three", max_sentences=1)
+    second = chunker.chunk_text("One. Two. Three", max_sentences=2)
+    assert splitter.calls == 1
+    assert len(first) == 3 and len(second) == 2
+
+    # Only one split is kept, so the other text evicts it
+    chunker.chunk_text("Four. Five", max_sentences=1)
+    chunker.chunk_text("One. Two. Three", max_sentences=1)
+    assert splitter.calls == 3
+
+    chunker.plain_text_chunker.clear_split_cache()
+    chunker.chunk_text("One. Two. Three", max_sentences=1)
+    assert splitter.calls == 4
+
+
+def test_sentence_split_cache_invalidation():
+    """Test that cached splits are not reused after the splitter setup changes."""
+    chunker = DocumentChunker(split_cache_size=8)
+    text = "One. Two. Three."
+    first = chunker.chunk_text(text, lang="en", max_sentences=1)
+    assert [ch.content for ch in first] == ["One.", "Two.", "Three."]
+
+    custom_splitter_registry.register(lambda t: [t], "en", name="whole_text")
+    try:
+        whole = chunker.chunk_text(text, lang="en", max_sentences=1)
+        assert [ch.content for ch in whole] == [text]
+    finally:
+        custom_splitter_registry.unregister("en")
+
+    chunker.plain_text_chunker.sentence_splitter = SentenceSplitter()
+    again = chunker.chunk_text(text, lang="en", max_sentences=1)
+    assert [ch.content for ch in again] == ["One.", "Two.", "Three."]
+
+
+def test_sentence_split_cache_threads_and_pickling():
+    """Test that concurrent evictions don't fail and that the cache is left out of the pickled state."""
+    plain_chunker = DocumentChunker(split_cache_size=8).plain_text_chunker
+    texts = [f"Sentence {i}. Another one." for i in range(400)]
+
+    errors = []
+
+    def split_all(batch):
+        try:
+            for text in batch:
+                assert len(plain_chunker._split_sentences(text, "en")) == 2
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=split_all, args=(texts[i::16],)) for i in range(16)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+    state = plain_chunker.__getstate__()
+    assert "_split_cache" not in state
+    restored = object.__new__(type(plain_chunker))
+    restored.__setstate__(state)
+    assert restored._split_cache == {}
+    assert restored._split_sentences("One. Two.", "en") == ["One.", "Two."]
 
 
 # --- Overlap Related Tests ---
@@ -185,6 +295,17 @@ def test_overlap_behavior(chunker):
 # --- Span Finder Tests ---
 
 
+def test_chunk_without_span(chunker):
+    """Test that include_span=False skips span metadata."""
+    chunks = chunker.chunk_text(TEXT, max_sentences=3, include_span=False)
+
+    assert chunks
+    assert all("span" not in chunk.metadata for chunk in chunks)
+    assert [chunk.metadata.chunk_num for chunk in chunks] == list(
+        range(1, len(chunks) + 1)
+    )
+
+
 @pytest.mark.parametrize(
     "text,query,expected",
     [
@@ -208,6 +329,15 @@ def test_span_finder(text: str, query: str, expected: tuple[int, int]):
     assert result == expected
 
 
+def test_span_finder_start():
+    """Test that DeterministicSpanFinder resumes searching from the given start."""
+    from chunklet.document_chunker.span_finder import DeterministicSpanFinder
+
+    finder = DeterministicSpanFinder("Hi, there. Hi, there.")
+    assert finder.find_span("Hi, there.", 1) == (11, 21)
+    assert finder.find_span("Hi there", 1)[0] == 11
+
+
 # --- Batch chunking Tests---
 
 
@@ -238,6 +368,142 @@ def test_batch_processing_successful(chunker, texts_input, expected_results_len)
     )
 
 
+def test_batch_language_agreeing_sample(chunker, monkeypatch):
+    """Test that a batch whose sample agrees on a language reuses it, detecting on text prefixes only."""
+    plain_chunker = chunker.plain_text_chunker
+    splitter = plain_chunker.sentence_splitter
+    detected_lengths = []
+    detect = splitter.detected_top_language
+
+    def recording_detect(text):
+        detected_lengths.append(len(text))
+        return detect(text)
+
+    monkeypatch.setattr(splitter, "detected_top_language", recording_detect)
+
+    texts = [
+        "Hello world. How are you today?",
+        "This is another English sentence about the weather. " * 100,
+    ]
+    assert plain_chunker._resolve_batch_language(texts) == "en"
+    assert max(detected_lengths) <= BATCH_LANG_SAMPLE_CHARS
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        [
+            "Hello world. How are you today?",
+            "Bonjour le monde. Comment allez-vous aujourd'hui?",
+        ],
+        ["Hello world. How are you today?", "12 34 !!"],
+    ],
+    ids=["mixed", "low_confidence"],
+)
+def test_batch_language_undecided_sample(chunker, texts):
+    """Test that a mixed or low-confidence sample keeps the per-text detection."""
+    assert chunker.plain_text_chunker._resolve_batch_language(texts) == "auto"
+
+
+def test_batch_language_sample_spans_batch(chunker):
+    """Test that a disagreeing text beyond the first few texts keeps the per-text detection."""
+    german = "Dr. Müller kam um 10 Uhr. Er sagte z. B. nichts. Dann ging er."
+    texts = [
+        f"This is English text number {i}. It talks about the weather."
+        for i in range(8)
+    ] + [german]
+    assert chunker.plain_text_chunker._resolve_batch_language(texts) == "auto"
+
+    results = chunker.chunk_texts(texts, max_sentences=1, show_progress=False)
+    assert "Er sagte z. B. nichts." in [chunk.content for chunk in results]
+
+
+def test_batch_language_custom_splitter():
+    """Test that custom splitters skip batch language detection."""
+
+    class WhitespaceSplitter(BaseSplitter):
+        def split_text(self, text: str, lang: str = "auto") -> list[str]:
+            return text.split()
+
+    chunker = DocumentChunker(sentence_splitter=WhitespaceSplitter())
+    texts = ["Hello world. How are you today?"] * 2
+    assert chunker.plain_text_chunker._resolve_batch_language(texts) == "auto"
+
+
+def test_batch_processing_duplicated_texts(chunker):
+    """Test that duplicated texts keep their position and get independent chunks."""
+    texts = ["Hello. How are you?", "I am fine.", "Hello. How are you?"]
+    results = list(
+        chunker.chunk_texts(
+            texts,
+            max_sentences=100,
+            separator=SEPARATOR_SENTINEL,
+            show_progress=False,
+            base_metadata={"tags": {"lang": "en"}, "pages": [1, 2], "range": (1, 2)},
+        )
+    )
+    groups = list(split_at(results, lambda x: x is SEPARATOR_SENTINEL))[:-1]
+
+    assert [[ch.content for ch in group] for group in groups] == [
+        ["Hello.\nHow are you?"],
+        ["I am fine."],
+        ["Hello.\nHow are you?"],
+    ]
+    assert groups[0][0].metadata is not groups[2][0].metadata
+    assert groups[0][0].metadata.tags is not groups[2][0].metadata.tags
+    assert groups[0][0].metadata.pages is not groups[2][0].metadata.pages
+    assert groups[2][0].metadata.tags == {"lang": "en"}
+    for group in groups:
+        assert isinstance(group[0].metadata.span, tuple)
+        assert isinstance(group[0].metadata.range, tuple)
+    assert groups[0][0].metadata.span == groups[2][0].metadata.span
+
+
+def test_batch_processing_duplicated_texts_break(chunker):
+    """Test that on_errors='break' stops at the failed text, even when a later text is a duplicate."""
+    texts = ["This is ok.", "This will fail.", "Another text.", "This is ok."]
+    results = chunker.chunk_texts(
+        texts,
+        max_tokens=12,
+        on_errors="break",
+        separator=SEPARATOR_SENTINEL,
+        show_progress=False,
+    )
+    groups = list(split_at(results, lambda x: x is SEPARATOR_SENTINEL))[:-1]
+
+    assert [[ch.content for ch in group] for group in groups] == [["This is ok."]]
+
+
+def test_batch_processing_sort_by_length(chunker):
+    """Test that dispatching the longest texts first keeps the input order."""
+    texts = ["Short.", "This text is a lot longer than the others.", "Mid length."]
+    results = chunker.chunk_texts(
+        texts,
+        max_sentences=100,
+        separator=SEPARATOR_SENTINEL,
+        show_progress=False,
+        sort_by_length=True,
+    )
+    groups = list(split_at(results, lambda x: x is SEPARATOR_SENTINEL))[:-1]
+
+    assert [group[0].content for group in groups] == texts
+
+
+def test_batch_processing_thread_backend(chunker):
+    """Test that the thread backend yields the same chunks as the process backend."""
+    texts = ["Hello. How are you?", "I am fine. Thanks for asking."]
+
+    def run(backend):
+        return [
+            ch.content
+            for ch in chunker.chunk_texts(
+                texts, max_sentences=1, backend=backend, show_progress=False
+            )
+        ]
+
+    assert sorted(run("thread")) == sorted(run("process"))
+
+
 def test_batch_processing_input_validation(chunker):
     """Test batch processing error handling on invalid input"""
     # Test that InvalidInputError is raised for input that is an iterable, but contains wrong types
@@ -81,6 +81,13 @@ def test_special_handler_exists(splitter, lang):
     assert result, f"Handler for '{lang}' returned empty result"
 
 
+def test_language_identifier_is_shared(splitter):
+    """The language detection model should be loaded once and shared by all splitters."""
+    other = SentenceSplitter()
+    assert other._identifier is splitter._identifier
+    assert other.detected_top_language("Hello world. How are you?")[0] == "en"
+
+
 # --- Custom Splitter Tests ---
 
 